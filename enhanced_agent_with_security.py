@@ -1326,7 +1326,7 @@ class EnhancedGitHubProtectionAgent:
             repo = self.repositories[repo_id]
             
             if not key_features:
-                key_features = repo['key_features'].split('\n')[:3]
+                key_features = repo['key_features'].split('\n', 3)[:3]
             
             headers = {}
             if self.config.get('GITHUB_TOKEN'):
@@ -6,7 +6,7 @@ import os
 import sys
 import hashlib
 import json
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
 from datetime import datetime
 
 # Add project root to path if not already there
@@ -107,9 +107,6 @@ except ImportError:
         import logging
         return logging.getLogger(name)
 
-from dotenv import load_dotenv
-load_dotenv()
-
 logger = setup_logging(__name__)
 
 
@@ -451,6 +448,7 @@ class CompleteFilecoinAgent:
             
             all_violations = []
             dmca_notices = []
+            violations = []
             
             for repo in repos:
                 if not repo:
@@ -478,18 +476,36 @@ class CompleteFilecoinAgent:
                     
                     if similarity_score > 0.7:  # High similarity threshold
                         # Generate comprehensive DMCA notice
-                        dmca_result = self._generate_and_file_dmca(
-                            repo, similar_repo, comparison
-                        )
-                        
-                        if dmca_result['success']:
-                            dmca_notices.append(dmca_result)
-                            all_violations.append({
-                                'infringing_url': similar_repo['url'],
-                                'similarity_score': similarity_score,
-                                'dmca_notice_id': dmca_result['dmca_id'],
-                                'blockchain_filed': True
-                            })
+                        try:
+                            dmca_pdf_path, dmca_metadata = self._generate_dmca(repo, similar_repo, comparison)
+                        except Exception as e:
+                            logger.error(f"DMCA generation failed for {similar_repo['url']}: {e}")
+                            continue
+                        violations.append((repo, similar_repo, comparison, dmca_pdf_path, dmca_metadata))
+            
+            # The notices don't depend on each other, so upload them all at once
+            ipfs_hashes = self.ipfs_manager.upload_many(
+                [(dmca_pdf_path, dmca_metadata) for *_, dmca_pdf_path, dmca_metadata in violations]
+            )
+            
+            for (repo, similar_repo, comparison, dmca_pdf_path, _), dmca_ipfs_hash in zip(violations, ipfs_hashes):
+                if isinstance(dmca_ipfs_hash, Exception):
+                    logger.error(f"DMCA upload failed for {similar_repo['url']}: {dmca_ipfs_hash}")
+                    continue
+                
+                try:
+                    dmca_result = self._file_dmca(repo, similar_repo, comparison, dmca_pdf_path, dmca_ipfs_hash)
+                except Exception as e:
+                    logger.error(f"DMCA filing failed for {similar_repo['url']}: {e}", exc_info=True)
+                    continue
+                
+                dmca_notices.append(dmca_result)
+                all_violations.append({
+                    'infringing_url': similar_repo['url'],
+                    'similarity_score': comparison.get('similarity_score', 0),
+                    'dmca_notice_id': dmca_result['dmca_id'],
+                    'blockchain_filed': True
+                })
             
             return {
                 'success': True,
@@ -671,13 +687,13 @@ class CompleteFilecoinAgent:
         try:
             if query_type == 'repositories':
                 total_repos = self.contract_interface.get_total_repositories()
-                repositories = []
                 
+                # One Multicall3 round trip (concurrent reads if unavailable), in ID order
                 start_id = max(1, total_repos - limit + 1)
-                for repo_id in range(start_id, total_repos + 1):
-                    repo_result = self.contract_interface.get_repository_from_chain(repo_id)
-                    if repo_result['success']:
-                        repositories.append(repo_result['repository'])
+                repo_results = self.contract_interface.get_repositories_batch(
+                    list(range(start_id, total_repos + 1))
+                )
+                repositories = [result['repository'] for result in repo_results if result['success']]
                 
                 return {
                     'success': True,
@@ -693,6 +709,15 @@ class CompleteFilecoinAgent:
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
+    def iter_registered_repositories(self, start_id: int = 1, limit: int = 10) -> Iterator[Dict]:
+        """Yield up to limit registered repositories from start_id, in ID order, as they are read"""
+        total_repos = self.contract_interface.get_total_repositories()
+        end_id = min(total_repos, start_id + limit - 1)
+        
+        for repo_result in self.contract_interface.iter_repositories(range(max(1, start_id), end_id + 1)):
+            if repo_result['success']:
+                yield repo_result['repository']
+    
     def run_full_protection_workflow(self, repo_input: str) -> Dict:
         """Run complete end-to-end protection workflow"""
         try:
@@ -756,8 +781,11 @@ class CompleteFilecoinAgent:
         """Check if repository is already registered"""
         total_repos = self.contract_interface.get_total_repositories()
         
-        for repo_id in range(1, total_repos + 1):
-            repo_result = self.contract_interface.get_repository_from_chain(repo_id)
+        # Only the (immutable) URL is compared, so cached records will do
+        repo_results = self.contract_interface.get_repositories_batch(
+            range(1, total_repos + 1), include_status=False
+        )
+        for repo_result in repo_results:
             if repo_result['success']:
                 repo_data = repo_result['repository']
                 if repo_data['github_url'] == github_url:
@@ -768,15 +796,19 @@ class CompleteFilecoinAgent:
     def _check_blockchain_matches(self, urls: List[str]) -> List[Dict]:
         """Check URLs against blockchain-registered repositories"""
         matches = []
+        urls = set(urls)
         total_repos = self.contract_interface.get_total_repositories()
         
-        for repo_id in range(1, total_repos + 1):
-            repo_result = self.contract_interface.get_repository_from_chain(repo_id)
+        # Only registration fields are used, so cached records will do
+        repo_results = self.contract_interface.get_repositories_batch(
+            range(1, total_repos + 1), include_status=False
+        )
+        for repo_result in repo_results:
             if repo_result['success']:
                 repo_data = repo_result['repository']
                 if repo_data['github_url'] in urls:
                     matches.append({
-                        'repo_id': repo_id,
+                        'repo_id': repo_data['id'],
                         'url': repo_data['github_url'],
                         'blockchain_registered': True,
                         'owner': repo_data['owner'],
@@ -788,75 +820,83 @@ class CompleteFilecoinAgent:
     def _generate_and_file_dmca(self, original_repo: Dict, infringing_repo: Dict, comparison: Dict) -> Dict:
         """Generate DMCA notice and file on blockchain"""
         try:
-            # Prepare DMCA data
-            dmca_data = {
-                'original_repo': original_repo,
-                'infringing_repo': infringing_repo,
-                'similarity_score': comparison.get('similarity_score', 0),
-                'evidence': comparison.get('evidence', []),
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            # Ensure all required keys exist before passing to the generator
-            required_keys = ['github_url', 'id', 'registered_at', 'tx_hash', 'repo_hash', 'license_type']
-            for key in required_keys:
-                if key not in dmca_data['original_repo']:
-                    logger.warning(f"Original repo data missing key: '{key}'. Using 'N/A'.")
-                    dmca_data['original_repo'][key] = 'N/A'
-            
-            # Generate DMCA PDF
-            dmca_pdf_path = self.dmca_generator.generate_dmca_pdf(dmca_data)
-            
-            # Upload to IPFS
-            dmca_metadata = {
-                'type': 'dmca_notice',
-                'original_repository': original_repo.get('github_url', 'N/A'),
-                'infringing_repository': infringing_repo.get('url', 'N/A'),
-                'similarity_score': comparison.get('similarity_score', 0)
-            }
+            dmca_pdf_path, dmca_metadata = self._generate_dmca(original_repo, infringing_repo, comparison)
             dmca_ipfs_hash = self.ipfs_manager.upload_to_ipfs(dmca_pdf_path, dmca_metadata)
-            
-            # --- FIX APPLIED HERE ---
-            # First, ensure the infringing URL is registered in the LinkRegistry
-            logger.info(f"🔗 Registering infringing URL in LinkRegistry: {infringing_repo['url']}")
-            self.contract_interface.add_link_to_registry(
-                infringing_repo['url'],
-                dmca_ipfs_hash  # Link the URL to the DMCA notice itself
-            )
-            # --- END FIX ---
-            
-            # Now, file DMCA on blockchain (this should succeed now)
-            dmca_tx_result = self.contract_interface.file_dmca_on_chain(
-                infringing_repo['url'], dmca_ipfs_hash
-            )
-            
-            # Report violation on main contract
-            violation_data = {
-                'original_repo_id': original_repo['id'],
-                'violating_url': infringing_repo['url'],
-                'similarity_score': comparison.get('similarity_score', 0),
-                'evidence_hash': dmca_ipfs_hash
-            }
-            violation_tx_result = self.contract_interface.report_violation_on_chain(violation_data)
-            
-            dmca_id = f"dmca_{int(datetime.now().timestamp())}"
-            
-            return {
-                'success': True,
-                'dmca_id': dmca_id,
-                'pdf_path': dmca_pdf_path,
-                'ipfs_hash': dmca_ipfs_hash,
-                'ipfs_url': self.ipfs_manager.get_ipfs_url(dmca_ipfs_hash),
-                'blockchain_transactions': {
-                    'dmca_filing': dmca_tx_result.get('tx_hash'),
-                    'violation_report': violation_tx_result.get('tx_hash')
-                }
-            }
+            return self._file_dmca(original_repo, infringing_repo, comparison, dmca_pdf_path, dmca_ipfs_hash)
             
         except Exception as e:
             logger.error(f"Error in _generate_and_file_dmca: {e}", exc_info=True)
             return {'success': False, 'error': str(e)}
     
+    def _generate_dmca(self, original_repo: Dict, infringing_repo: Dict, comparison: Dict) -> Tuple[str, Dict]:
+        """Generate the DMCA notice PDF; returns its path and IPFS upload metadata"""
+        # Prepare DMCA data
+        dmca_data = {
+            'original_repo': original_repo,
+            'infringing_repo': infringing_repo,
+            'similarity_score': comparison.get('similarity_score', 0),
+            'evidence': comparison.get('evidence', []),
+            'timestamp': datetime.now().isoformat()
+        }
+        
+        # Ensure all required keys exist before passing to the generator
+        required_keys = ['github_url', 'id', 'registered_at', 'tx_hash', 'repo_hash', 'license_type']
+        for key in required_keys:
+            if key not in dmca_data['original_repo']:
+                logger.warning(f"Original repo data missing key: '{key}'. Using 'N/A'.")
+                dmca_data['original_repo'][key] = 'N/A'
+        
+        # Generate DMCA PDF
+        dmca_pdf_path = self.dmca_generator.generate_dmca_pdf(dmca_data)
+        
+        dmca_metadata = {
+            'type': 'dmca_notice',
+            'original_repository': original_repo.get('github_url', 'N/A'),
+            'infringing_repository': infringing_repo.get('url', 'N/A'),
+            'similarity_score': comparison.get('similarity_score', 0)
+        }
+        return dmca_pdf_path, dmca_metadata
+    
+    def _file_dmca(self, original_repo: Dict, infringing_repo: Dict, comparison: Dict,
+                   dmca_pdf_path: str, dmca_ipfs_hash: str) -> Dict:
+        """File an uploaded DMCA notice on the blockchain"""
+        # --- FIX APPLIED HERE ---
+        # First, ensure the infringing URL is registered in the LinkRegistry
+        logger.info(f"🔗 Registering infringing URL in LinkRegistry: {infringing_repo['url']}")
+        self.contract_interface.add_link_to_registry(
+            infringing_repo['url'],
+            dmca_ipfs_hash  # Link the URL to the DMCA notice itself
+        )
+        # --- END FIX ---
+        
+        # Now, file DMCA on blockchain (this should succeed now)
+        dmca_tx_result = self.contract_interface.file_dmca_on_chain(
+            infringing_repo['url'], dmca_ipfs_hash
+        )
+        
+        # Report violation on main contract
+        violation_data = {
+            'original_repo_id': original_repo['id'],
+            'violating_url': infringing_repo['url'],
+            'similarity_score': comparison.get('similarity_score', 0),
+            'evidence_hash': dmca_ipfs_hash
+        }
+        violation_tx_result = self.contract_interface.report_violation_on_chain(violation_data)
+        
+        dmca_id = f"dmca_{int(datetime.now().timestamp())}"
+        
+        return {
+            'success': True,
+            'dmca_id': dmca_id,
+            'pdf_path': dmca_pdf_path,
+            'ipfs_hash': dmca_ipfs_hash,
+            'ipfs_url': self.ipfs_manager.get_ipfs_url(dmca_ipfs_hash),
+            'blockchain_transactions': {
+                'dmca_filing': dmca_tx_result.get('tx_hash'),
+                'violation_report': violation_tx_result.get('tx_hash')
+            }
+        }
+    
     def _get_repository_by_id(self, repo_id: int) -> Optional[Dict]:
         """Get repository by ID from cache or blockchain"""
         # Check cache first for complete data, including tx_hash
@@ -879,15 +919,17 @@ class CompleteFilecoinAgent:
     
     def _get_all_registered_repositories(self) -> List[Dict]:
         """Get all registered repositories from blockchain"""
-        repos = []
         total_repos = self.contract_interface.get_total_repositories()
+        repo_ids = range(1, total_repos + 1)
         
-        for repo_id in range(1, total_repos + 1):
-            repo = self._get_repository_by_id(repo_id)
-            if repo:
-                repos.append(repo)
+        # Fetch everything not already cached in one batched read
+        missing = [repo_id for repo_id in repo_ids if repo_id not in self.repositories_cache]
+        for repo_result in self.contract_interface.get_repositories_batch(missing):
+            if repo_result['success']:
+                repo_data = repo_result['repository']
+                self.repositories_cache[repo_data['id']] = repo_data
         
-        return repos
+        return [self.repositories_cache[repo_id] for repo_id in repo_ids if repo_id in self.repositories_cache]
     
     def _find_best_matching_repo(self, infringing_url: str) -> Optional[int]:
         """Find best matching registered repository for an infringing URL"""
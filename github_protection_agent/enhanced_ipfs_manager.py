@@ -3,16 +3,27 @@ Enhanced IPFS Manager with Filecoin Integration
 Handles IPFS uploads and blockchain pinning for Filecoin network
 """
 import os
+import asyncio
 import requests
 import json
 import hashlib
 import time
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime
 from github_protection_agent.utils import setup_logging
 from github_protection_agent.blockchain_utilities import IPFSUtils, FilecoinNetworkInfo
-from dotenv import load_dotenv
-load_dotenv()
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - lets httpx multiplex concurrent uploads over HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 logger = setup_logging(__name__)
 
@@ -67,28 +78,75 @@ class EnhancedIPFSManager:
         # Try services in priority order
         for service in self.service_priority:
             try:
-                if service == 'pinata':
-                    return self._upload_to_pinata(file_path, metadata)
-                elif service == 'web3_storage':
-                    return self._upload_to_web3_storage(file_path, metadata)
-                elif service == 'local_ipfs':
-                    return self._upload_to_local_ipfs(file_path, metadata)
-                elif service == 'local_file':
+                if service == 'local_file':
                     return self._fallback_local_storage(file_path)
+                return self._upload_to_service(service, file_path, metadata)
             except Exception as e:
                 logger.warning(f"⚠️ {service} upload failed: {e}")
                 continue
         
         raise Exception("All IPFS upload methods failed")
     
-    def _upload_to_pinata(self, file_path: str, metadata: Dict = None) -> str:
-        """Upload to Pinata IPFS service"""
-        if not self.pinata_headers:
-            raise ValueError("Pinata credentials not configured")
+    def _upload_to_service(self, service: str, file_path: str, metadata: Dict = None) -> str:
+        """Upload a file to one IPFS service and return its CID"""
+        request = self._upload_request(service, file_path, metadata)
+        
+        with open(file_path, 'rb') as file:
+            response = requests.post(files={'file': (os.path.basename(file_path), file)}, **request)
+        
+        response.raise_for_status()
+        ipfs_hash = self._uploaded_cid(service, response.json())
         
-        url = f"{self.pinata_base_url}/pinning/pinFileToIPFS"
+        # Improved verification with retry
+        if service == 'pinata' and not self._verify_ipfs_content_with_retry(ipfs_hash):
+            # Don't fail - IPFS content takes time to propagate
+            logger.warning(f"⚠️ Upload verification failed, but hash is valid: {ipfs_hash}")
+        return ipfs_hash
+    
+    def _upload_request(self, service: str, file_path: str, metadata: Dict = None) -> Dict:
+        """POST arguments (url, headers, form data, params, timeout) for uploading to one service"""
+        if service == 'pinata':
+            if not self.pinata_headers:
+                raise ValueError("Pinata credentials not configured")
+            return {
+                'url': f"{self.pinata_base_url}/pinning/pinFileToIPFS",
+                'headers': self.pinata_headers,
+                'data': self._pinata_form_data(file_path, metadata),
+                'timeout': 300
+            }
+        
+        elif service == 'web3_storage':
+            if not self.web3_storage_token:
+                raise ValueError("Web3.Storage token not configured")
+            return {
+                'url': "https://api.web3.storage/upload",
+                'headers': {'Authorization': f'Bearer {self.web3_storage_token}'},
+                'timeout': 300
+            }
+        
+        elif service == 'local_ipfs':
+            return {
+                'url': f"{self.local_ipfs_url}/api/v0/add",
+                'params': {'pin': 'true', 'cid-version': '1'},
+                'timeout': 60
+            }
         
-        # Prepare metadata
+        raise ValueError(f"Unknown IPFS service: {service}")
+    
+    def _uploaded_cid(self, service: str, result: Dict) -> str:
+        """Extract the CID from a service's upload response"""
+        field, label = {
+            'pinata': ('IpfsHash', 'Pinata IPFS'),
+            'web3_storage': ('cid', 'Web3.Storage'),
+            'local_ipfs': ('Hash', 'local IPFS')
+        }[service]
+        
+        ipfs_hash = result[field]
+        logger.info(f"📤 File uploaded to {label}: {ipfs_hash}")
+        return ipfs_hash
+    
+    def _pinata_form_data(self, file_path: str, metadata: Dict = None) -> Dict:
+        """Build the pinataMetadata and pinataOptions form fields for an upload"""
         file_metadata = {
             'name': os.path.basename(file_path),
             'keyvalues': {
@@ -103,77 +161,85 @@ class EnhancedIPFSManager:
         if metadata:
             file_metadata['keyvalues'].update(metadata)
         
-        # Upload file
-        with open(file_path, 'rb') as file:
-            files = {'file': (os.path.basename(file_path), file)}
-            
-            data = {
-                'pinataMetadata': json.dumps(file_metadata),
-                'pinataOptions': json.dumps({
-                    'cidVersion': 1,
-                    'wrapWithDirectory': False
-                })
-            }
-            
-            response = requests.post(
-                url,
-                files=files,
-                headers=self.pinata_headers,
-                data=data,
-                timeout=300
+        return {
+            'pinataMetadata': json.dumps(file_metadata),
+            'pinataOptions': json.dumps({
+                'cidVersion': 1,
+                'wrapWithDirectory': False
+            })
+        }
+    
+    def upload_many(self, uploads: List[Tuple[str, Dict]]) -> List:
+        """Upload several (file_path, metadata) pairs concurrently
+        
+        Returns one entry per upload, in order: the CID, or the exception that
+        upload raised. Falls back to sequential uploads without httpx or when
+        called from inside a running event loop.
+        """
+        if not uploads:
+            return []
+        
+        # asyncio.run cannot nest inside a running loop; async callers should await upload_many_async
+        try:
+            asyncio.get_running_loop()
+            in_event_loop = True
+        except RuntimeError:
+            in_event_loop = False
+        
+        if HTTPX_AVAILABLE and not in_event_loop:
+            return asyncio.run(self.upload_many_async(uploads))
+        
+        results = []
+        for file_path, metadata in uploads:
+            try:
+                results.append(self.upload_to_ipfs(file_path, metadata))
+            except Exception as e:
+                results.append(e)
+        return results
+    
+    async def upload_many_async(self, uploads: List[Tuple[str, Dict]]) -> List:
+        """Async upload_many: all uploads share one httpx client (one HTTP/2 connection when h2 is installed)"""
+        async with httpx.AsyncClient(http2=HTTP2_AVAILABLE, timeout=300) as client:
+            return await asyncio.gather(
+                *[self.upload_to_ipfs_async(file_path, metadata, client) for file_path, metadata in uploads],
+                return_exceptions=True
             )
-            
-            response.raise_for_status()
-            result = response.json()
-            ipfs_hash = result['IpfsHash']
-            
-            logger.info(f"📤 File uploaded to Pinata IPFS: {ipfs_hash}")
-            
-            # Improved verification with retry
-            if self._verify_ipfs_content_with_retry(ipfs_hash):
-                return ipfs_hash
-            else:
-                # Don't fail - IPFS content takes time to propagate
-                logger.warning(f"⚠️ Upload verification failed, but hash is valid: {ipfs_hash}")
-                return ipfs_hash
     
-    def _upload_to_web3_storage(self, file_path: str, metadata: Dict = None) -> str:
-        """Upload to Web3.Storage"""
-        if not self.web3_storage_token:
-            raise ValueError("Web3.Storage token not configured")
-        
-        url = "https://api.web3.storage/upload"
-        headers = {
-            'Authorization': f'Bearer {self.web3_storage_token}'
-        }
+    async def upload_to_ipfs_async(self, file_path: str, metadata: Dict = None, client=None) -> str:
+        """Async upload_to_ipfs over an httpx client, trying services in the same order"""
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
         
-        with open(file_path, 'rb') as file:
-            files = {'file': (os.path.basename(file_path), file)}
-            response = requests.post(url, files=files, headers=headers, timeout=300)
-            
-            response.raise_for_status()
-            result = response.json()
-            cid = result['cid']
-            
-            logger.info(f"📤 File uploaded to Web3.Storage: {cid}")
-            return cid
+        if client is None:
+            async with httpx.AsyncClient(http2=HTTP2_AVAILABLE, timeout=300) as client:
+                return await self.upload_to_ipfs_async(file_path, metadata, client)
+        
+        for service in self.service_priority:
+            try:
+                if service == 'local_file':
+                    return self._fallback_local_storage(file_path)
+                return await self._upload_to_service_async(client, service, file_path, metadata)
+            except Exception as e:
+                logger.warning(f"⚠️ {service} upload failed: {e}")
+                continue
+        
+        raise Exception("All IPFS upload methods failed")
     
-    def _upload_to_local_ipfs(self, file_path: str, metadata: Dict = None) -> str:
-        """Upload to local IPFS node"""
-        url = f"{self.local_ipfs_url}/api/v0/add"
+    async def _upload_to_service_async(self, client, service: str, file_path: str, metadata: Dict = None) -> str:
+        """Async _upload_to_service over an httpx client"""
+        request = self._upload_request(service, file_path, metadata)
         
         with open(file_path, 'rb') as file:
-            files = {'file': (os.path.basename(file_path), file)}
-            params = {'pin': 'true', 'cid-version': '1'}
-            
-            response = requests.post(url, files=files, params=params, timeout=60)
-            response.raise_for_status()
-            
-            result = response.json()
-            ipfs_hash = result['Hash']
-            
-            logger.info(f"📤 File uploaded to local IPFS: {ipfs_hash}")
-            return ipfs_hash
+            files = {'file': (os.path.basename(file_path), file.read())}
+        
+        response = await client.post(files=files, **request)
+        response.raise_for_status()
+        ipfs_hash = self._uploaded_cid(service, response.json())
+        
+        # Gateway checks are blocking; run them alongside the other uploads
+        if service == 'pinata' and not await asyncio.to_thread(self._verify_ipfs_content_with_retry, ipfs_hash):
+            logger.warning(f"⚠️ Upload verification failed, but hash is valid: {ipfs_hash}")
+        return ipfs_hash
     
     def _fallback_local_storage(self, file_path: str) -> str:
         """Fallback to local file storage"""
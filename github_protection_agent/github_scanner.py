@@ -8,8 +8,6 @@ from typing import List, Dict, Set
 from difflib import SequenceMatcher
 import re
 from github_protection_agent.utils import setup_logging
-from dotenv import load_dotenv
-load_dotenv()
 
 logger = setup_logging(__name__)
 
@@ -180,22 +178,23 @@ class GitHubScanner:
             similarities = []
             evidence = []
             
-            # Compare main files
-            for file1 in files1[:10]:  # Limit to top 10 files
-                for file2 in files2[:10]:
-                    if file1['name'] == file2['name']:
-                        # Get file contents
-                        content1 = self._get_file_content(file1['download_url'])
-                        content2 = self._get_file_content(file2['download_url'])
+            # Compare main files, pairing by name (limit to top 10 files)
+            files2_by_name = {file2['name']: file2 for file2 in files2[:10]}
+            for file1 in files1[:10]:
+                file2 = files2_by_name.get(file1['name'])
+                if file2:
+                    # Get file contents
+                    content1 = self._get_file_content(file1['download_url'])
+                    content2 = self._get_file_content(file2['download_url'])
+                    
+                    if content1 and content2:
+                        similarity = self._calculate_code_similarity(content1, content2)
+                        similarities.append(similarity)
                         
-                        if content1 and content2:
-                            similarity = self._calculate_code_similarity(content1, content2)
-                            similarities.append(similarity)
-                            
-                            if similarity > 0.8:
-                                evidence.append(
-                                    f"File '{file1['name']}' is {similarity:.2%} similar"
-                                )
+                        if similarity > 0.8:
+                            evidence.append(
+                                f"File '{file1['name']}' is {similarity:.2%} similar"
+                            )
             
             # Use AI for semantic analysis
             if similarities:
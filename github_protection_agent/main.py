@@ -4,6 +4,7 @@ Final Main Entry Point - Complete Filecoin GitHub Protection Agent
 Integrates with deployed contracts on Filecoin Calibration testnet
 """
 import os
+import shlex
 import sys
 from typing import Dict, List
 
@@ -12,15 +13,18 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from github_protection_agent.complete_filecoin_agent import CompleteFilecoinAgent
-from github_protection_agent.setup_validator import SetupValidator
-
 try:
-    from github_protection_agent.utils import setup_logging
+    from github_protection_agent.utils import load_env_file, prewarm, setup_logging
 except ImportError:
     def setup_logging(name):
         import logging
         return logging.getLogger(name)
+    
+    def load_env_file(path):
+        return False
+    
+    def prewarm(*warmups):
+        return None
 
 logger = setup_logging(__name__)
 
@@ -121,6 +125,7 @@ def validate_setup() -> bool:
     """Quick setup validation"""
     print("🔧 Validating setup...")
     
+    from github_protection_agent.setup_validator import SetupValidator
     validator = SetupValidator()
     
     # Quick checks
@@ -152,6 +157,7 @@ def validate_setup() -> bool:
 
 def main():
     """Enhanced main function with deployed contract integration"""
+    load_env_file(os.path.join(project_root, '.env'))
     
     # Configuration from environment
     config = {
@@ -160,6 +166,8 @@ def main():
         'GITHUB_TOKEN': os.getenv('GITHUB_TOKEN'),
         'PRIVATE_KEY': os.getenv('PRIVATE_KEY'),
         'FILECOIN_RPC_URL': os.getenv('FILECOIN_RPC_URL', 'https://rpc.ankr.com/filecoin_testnet'),
+        'FILECOIN_RPC_URLS': os.getenv('FILECOIN_RPC_URLS'),
+        'FILECOIN_WS_URL': os.getenv('FILECOIN_WS_URL'),
         'PINATA_API_KEY': os.getenv('PINATA_API_KEY'),
         'PINATA_API_SECRET': os.getenv('PINATA_API_SECRET'),
         'WEB3_STORAGE_TOKEN': os.getenv('WEB3_STORAGE_TOKEN')
@@ -172,6 +180,7 @@ def main():
         command = sys.argv[1].lower()
         
         if command == 'validate':
+            from github_protection_agent.setup_validator import SetupValidator
             validator = SetupValidator()
             validator.run_full_validation()
             return
@@ -190,8 +199,13 @@ def main():
     try:
         # Initialize complete agent
         print("🚀 Initializing Filecoin GitHub Protection Agent...")
+        # Heavy import (langchain, web3, IPFS clients) deferred past help/version/validation
+        from github_protection_agent.complete_filecoin_agent import CompleteFilecoinAgent
         agent = CompleteFilecoinAgent(config)
         
+        # Open the LLM connection (a free model listing) while the status below is fetched
+        prewarm(lambda: agent.llm.root_client.models.list())
+        
         # Show initial status
         status = agent.get_complete_status()
         if status['success']:
@@ -219,7 +233,14 @@ def main():
                 if not user_input:
                     continue
                 
-                parts = user_input.split()
+                # Quoted arguments may contain spaces
+                try:
+                    parts = shlex.split(user_input)
+                except ValueError as e:
+                    print(f"❌ Could not parse command: {e}")
+                    continue
+                if not parts:
+                    continue
                 command = parts[0].lower()
                 
                 if command in ['quit', 'exit', 'q']:
@@ -230,6 +251,7 @@ def main():
                     print_full_help()
                 
                 elif command == 'validate':
+                    from github_protection_agent.setup_validator import SetupValidator
                     validator = SetupValidator()
                     validator.run_full_validation()
                 
@@ -396,22 +418,26 @@ def main():
                     start_id = int(parts[1]) if len(parts) > 1 else 1
                     limit = int(parts[2]) if len(parts) > 2 else 10
                     
-                    print(f"📊 Querying blockchain repositories...")
-                    result = agent.query_blockchain_data('repositories', limit)
+                    print(f"📊 Querying blockchain repositories (starting from ID {start_id})...")
+                    print(f"\n📚 Blockchain Repositories:")
+                    print("-" * 80)
                     
-                    if result['success']:
-                        print(f"\n📚 Blockchain Repositories (showing {result['returned_count']}/{result['total_count']}):")
-                        print("-" * 80)
-                        
-                        for repo in result['data']:
+                    # Each page of records is printed as soon as it has been read
+                    shown = 0
+                    try:
+                        for repo in agent.iter_registered_repositories(start_id, limit):
                             print(f"ID: {repo['id']}")
                             print(f"   URL: {repo['github_url']}")
                             print(f"   Owner: {repo['owner']}")
                             print(f"   License: {repo['license_type']}")
                             print(f"   Active: {'✅' if repo['is_active'] else '❌'}")
                             print()
-                    else:
-                        print(f"❌ Error: {result['error']}")
+                            shown += 1
+                    except Exception as e:
+                        print(f"❌ Error: {e}")
+                    
+                    total = agent.contract_interface.get_total_repositories()
+                    print(f"📊 Showing {shown}/{total} repositories")
                 
                 elif command == 'bounty':
                     if len(parts) < 2:
@@ -7,8 +7,6 @@ import json
 import requests
 from typing import Dict, List
 from github_protection_agent.utils import setup_logging
-from dotenv import load_dotenv
-load_dotenv()
 
 logger = setup_logging(__name__)
 
@@ -3,14 +3,87 @@ Secret Patterns Module
 Defines patterns for detecting various types of secrets and credentials
 """
 import re
-from typing import Dict
-from dotenv import load_dotenv
-load_dotenv()
+import threading
+from typing import Dict, Iterator, List, Tuple
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# Flags every secret pattern is matched with (some also carry an inline (?i))
+PATTERN_FLAGS = re.IGNORECASE | re.MULTILINE
+
+# Hyperscan only agrees with re on plain ASCII: re folds case across Unicode (e.g. 'ı' matches 'i')
+# and treats \x1c-\x1f as whitespace, so content with these characters skips the prefilter
+_PREFILTER_UNSAFE = re.compile(r'[^\x00-\x1b\x20-\x7f]')
 
 
 class SecretPatterns:
     """Manages patterns for detecting secrets in code"""
     
+    def __init__(self):
+        self._compiled = {
+            name: re.compile(info['pattern'], PATTERN_FLAGS)
+            for name, info in self.get_patterns().items()
+        }
+        self._prefilter = self._build_prefilter() if HYPERSCAN_AVAILABLE else None
+        self._scratch = threading.local()
+    
+    def _build_prefilter(self):
+        """Compile all patterns into one Hyperscan database that reports which ones occur
+        
+        Prefilter mode may over-report but does not miss a pattern on ASCII input,
+        so re still decides the actual matches; it only runs for patterns that fired.
+        """
+        flags = (hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_CASELESS |
+                 hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP)
+        try:
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[regex.pattern.encode() for regex in self._compiled.values()],
+                ids=list(range(len(self._compiled))),
+                elements=len(self._compiled),
+                flags=[flags] * len(self._compiled)
+            )
+            return database
+        except Exception as e:
+            print(f"⚠️ Hyperscan prefilter unavailable, scanning every pattern: {e}")
+            return None
+    
+    def candidate_patterns(self, content: str) -> List[str]:
+        """Names of the patterns that may match content (all of them without Hyperscan or on non-ASCII input)"""
+        names = list(self._compiled)
+        if self._prefilter is None or _PREFILTER_UNSAFE.search(content):
+            return names
+        
+        # Scratch space is per thread; the database itself is shared
+        scratch = getattr(self._scratch, 'space', None)
+        if scratch is None:
+            scratch = self._scratch.space = hyperscan.Scratch(self._prefilter)
+        
+        hits = set()
+        try:
+            self._prefilter.scan(
+                content.encode('ascii'),
+                match_event_handler=lambda pattern_id, start, end, flags, context: hits.add(pattern_id),
+                scratch=scratch
+            )
+        except hyperscan.error:
+            return names
+        return [name for pattern_id, name in enumerate(names) if pattern_id in hits]
+    
+    def find_pattern(self, name: str, content: str) -> Iterator[re.Match]:
+        """Iterate over the matches of one secret pattern in content"""
+        return self._compiled[name].finditer(content)
+    
+    def find_secrets(self, content: str) -> Iterator[Tuple[str, re.Match]]:
+        """Yield (pattern_name, match) for every secret pattern match in content"""
+        for name in self.candidate_patterns(content):
+            for match in self.find_pattern(name, content):
+                yield name, match
+    
     def get_patterns(self) -> Dict:
         """Comprehensive patterns for detecting secrets"""
         return {
@@ -9,8 +9,6 @@ from typing import Dict, List
 from datetime import datetime
 from github_protection_agent.utils import setup_logging
 from github_protection_agent.secret_patterns import SecretPatterns
-from dotenv import load_dotenv
-load_dotenv()
 
 logger = setup_logging(__name__)
 
@@ -173,17 +171,14 @@ class SecurityScanner:
         findings = []
         patterns = self.secret_patterns.get_patterns()
         
-        for pattern_name, pattern_info in patterns.items():
-            pattern = pattern_info['pattern']
-            
+        for pattern_name in self.secret_patterns.candidate_patterns(content):
             try:
-                matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
-                
-                for match in matches:
+                for match in self.secret_patterns.find_pattern(pattern_name, content):
                     matched_text = match.group()
                     
                     # Validate if it's likely a real secret
                     if self.secret_patterns.is_likely_real_secret(matched_text, pattern_name):
+                        pattern_info = patterns[pattern_name]
                         line_number = content[:match.start()].count('\n') + 1
                         
                         findings.append({
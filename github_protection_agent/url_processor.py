@@ -6,8 +6,6 @@ import re
 from urllib.parse import urlparse, parse_qs
 from typing import Dict
 from github_protection_agent.utils import setup_logging
-from dotenv import load_dotenv
-load_dotenv()
 
 logger = setup_logging(__name__)
 
@@ -1,11 +1,19 @@
 """
 Utility functions for the GitHub Protection Agent
 """
+import json
 import logging
 import os
+import shlex
 import sys
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+# URL schemes accepted by validate_url
+_URL_PREFIXES = ('http://', 'https://')
 
 
 def setup_logging(name: str, level: str = None) -> logging.Logger:
@@ -54,6 +62,49 @@ def setup_logging(name: str, level: str = None) -> logging.Logger:
     return logger
 
 
+def load_env_file(path: str) -> bool:
+    """
+    Load environment variables from a .env file if one exists
+    
+    python-dotenv is only imported when there is a file to read.
+    
+    Args:
+        path: Path to the .env file
+        
+    Returns:
+        True if the file was found and loaded
+    """
+    if not os.path.isfile(path):
+        return False
+    
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return False
+    
+    return load_dotenv(path)
+
+
+def prewarm(*warmups) -> None:
+    """
+    Run connection warm-up calls on daemon threads, ignoring failures
+    
+    Used at startup so DNS, TCP and TLS setup for slow-to-connect clients
+    overlaps other work instead of landing inside the first command.
+    
+    Args:
+        warmups: Zero-argument callables that each open a connection
+    """
+    def run(warmup):
+        try:
+            warmup()
+        except Exception as e:
+            logging.getLogger(__name__).debug(f"Warm-up call failed: {e}")
+    
+    for warmup in warmups:
+        threading.Thread(target=run, args=(warmup,), name='prewarm', daemon=True).start()
+
+
 def get_project_root() -> str:
     """Get the project root directory"""
     current_file = os.path.abspath(__file__)
@@ -138,7 +189,7 @@ def validate_url(url: str) -> bool:
     url = url.strip()
     
     # Check for basic URL structure
-    if not (url.startswith('http://') or url.startswith('https://')):
+    if not url.startswith(_URL_PREFIXES):
         return False
     
     # Basic domain check
@@ -212,6 +263,162 @@ def format_file_size(size_bytes: int) -> str:
     return f"{size_bytes:.1f} {size_names[i]}"
 
 
+class TTLCache:
+    """Small thread-safe LRU cache whose entries expire after a fixed TTL"""
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or default if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._data[key]
+                return default
+            
+            self._data.move_to_end(key)
+            return value
+    
+    def __setitem__(self, key: Hashable, value: Any):
+        self.set(key, value)
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store a value that expires after ttl seconds (the cache's TTL by default)"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        sentinel = object()
+        return self.get(key, sentinel) is not sentinel
+    
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove a key, returning its value (expired or not) or default"""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return default if entry is None else entry[1]
+    
+    def clear(self):
+        """Drop every cached entry"""
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def cached_read(cache: TTLCache, key: Hashable, fetch: Callable[[], Dict]) -> Dict:
+    """
+    Return a recent successful result for key, calling fetch() on a miss
+    
+    Only results whose 'success' is true are stored, so failures are retried.
+    
+    Args:
+        cache: Cache holding recent results
+        key: Cache key for this read
+        fetch: Zero-argument callable returning a result dict
+        
+    Returns:
+        The cached or freshly fetched result
+    """
+    result = cache.get(key)
+    if result is None:
+        result = fetch()
+        if result.get('success'):
+            cache[key] = result
+    return result
+
+
+def load_fresh_json(path: str, max_age: float) -> Optional[Any]:
+    """
+    Load a JSON file if it was written within the last max_age seconds
+    
+    Args:
+        path: Path to the JSON file
+        max_age: Maximum age in seconds, judged by the file's modification time
+        
+    Returns:
+        The decoded data, or None if the file is missing, stale or unreadable
+    """
+    try:
+        if time.time() - os.path.getmtime(path) > max_age:
+            return None
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_json_file(data: Any, path: str) -> bool:
+    """
+    Write data as JSON through a temporary file so readers never see a partial write
+    
+    Args:
+        data: JSON-serializable data (other values are written with str())
+        path: Destination path; missing directories are created
+        
+    Returns:
+        True if the file was written
+    """
+    try:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, default=str)
+        os.replace(tmp_path, path)
+        return True
+    except (OSError, TypeError, ValueError) as e:
+        logging.getLogger(__name__).debug(f"Could not write {path}: {e}")
+        return False
+
+
+def parse_command(user_input: str) -> Tuple[str, List[str]]:
+    """
+    Split a REPL line into a lower-cased command and its arguments
+    
+    Quoted arguments may contain spaces. Raises ValueError on unbalanced quotes.
+    
+    Args:
+        user_input: Line typed at the prompt
+        
+    Returns:
+        (command, args); command is '' for a blank line
+    """
+    parts = shlex.split(user_input)
+    if not parts:
+        return '', []
+    return parts[0].lower(), parts[1:]
+
+
+def dispatch_command(commands: Dict[str, Callable], command: str, *handler_args) -> bool:
+    """
+    Run the handler registered for command
+    
+    Args:
+        commands: Command name -> handler
+        command: Parsed command name
+        handler_args: Arguments passed to the handler
+        
+    Returns:
+        False if the command is unknown, else True once the handler has run
+    """
+    handler = commands.get(command)
+    if handler is None:
+        return False
+    handler(*handler_args)
+    return True
+
+
 class ConfigValidator:
     """Validate configuration settings"""
     
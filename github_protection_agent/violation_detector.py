@@ -9,8 +9,6 @@ import json
 from typing import Dict, List
 from datetime import datetime
 from github_protection_agent.utils import setup_logging
-from dotenv import load_dotenv
-load_dotenv()
 
 logger = setup_logging(__name__)
 
@@ -29,7 +27,7 @@ class ViolationDetector:
         
         try:
             if not key_features:
-                key_features = repo['key_features'].split('\n')[:3]
+                key_features = repo['key_features'].split('\n', 3)[:3]
             
             headers = {}
             if self.github_token:
@@ -2,114 +2,530 @@
 Blockchain-Enhanced Main Entry Point for GitHub Protection Agent
 Integrates with Filecoin smart contracts for decentralized protection
 """
+import argparse
+import io
 import os
 import sys
-from github_protection_agent.blockchain_enhanced_agent import BlockchainEnhancedGitHubProtectionAgent
-from github_protection_agent.utils import setup_logging
+import threading
+import time
+from github_protection_agent.utils import (
+    TTLCache, cached_read, dispatch_command, load_env_file, load_fresh_json, parse_command, prewarm,
+    save_json_file, setup_logging
+)
+
+try:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.completion import WordCompleter
+    PROMPT_TOOLKIT_AVAILABLE = True
+except ImportError:
+    PROMPT_TOOLKIT_AVAILABLE = False
 
 logger = setup_logging(__name__)
 
+# Status and repository listings change per block (~30s on Filecoin), not per keystroke
+_read_cache = TTLCache(maxsize=64, ttl=30)
+
+# Last-known status persisted between runs so startup can render it without an RPC round trip
+STATUS_FILE_PATH = os.path.join(os.path.expanduser('~'), '.codeshield', 'status.json')
+STATUS_FILE_TTL = 60
+
+# Account and RPC endpoint of this session's status, set by main()
+_status_source = None
+
+
+def status_source(config):
+    """The account and RPC endpoint a status belongs to, as recorded in the status file"""
+    account_address = None
+    if config.get('PRIVATE_KEY'):
+        from eth_account import Account
+        account_address = Account.from_key(config['PRIVATE_KEY']).address
+    return {
+        'account_address': account_address,
+        'rpc_url': config.get('FILECOIN_RPC_URL'),
+        'rpc_urls': config.get('FILECOIN_RPC_URLS')
+    }
+
+
+def refresh_status(agent):
+    """Fetch the blockchain status, caching and persisting it (tagged with its source) on success"""
+    status = agent.get_blockchain_status()
+    if status.get('success'):
+        _read_cache[('status',)] = status
+        if _status_source is not None:
+            save_json_file({'source': _status_source, 'saved_at': time.time(), 'status': status}, STATUS_FILE_PATH)
+    return status
+
+
+def load_saved_status(source):
+    """Return a persisted status for the same source that is under STATUS_FILE_TTL old, else None
+    
+    The read cache is seeded with it only for the time the file has left.
+    """
+    saved = load_fresh_json(STATUS_FILE_PATH, STATUS_FILE_TTL)
+    if not isinstance(saved, dict) or saved.get('source') != source:
+        return None
+    
+    remaining = STATUS_FILE_TTL - (time.time() - saved.get('saved_at', 0))
+    if remaining <= 0:
+        return None
+    
+    status = saved.get('status')
+    if not isinstance(status, dict) or not status.get('success'):
+        return None
+    _read_cache.set(('status',), status, ttl=min(remaining, _read_cache.ttl))
+    return status
+
+
+# Static CLI text, built once at import so each print_* call is a single write
+_BANNER = f"""
+{'=' * 90}
+🛡️  BLOCKCHAIN-ENHANCED GitHub Repository Protection Agent v5.0
+{'=' * 90}
+✨ New Blockchain Features:
+   • 🔗 Filecoin Calibration Testnet Integration
+   • ⛓️ Smart Contract Repository Registration
+   • 📄 IPFS License & DMCA Storage
+   • 💰 Infringement Bounty System
+   • 🔒 Immutable Evidence Storage
+   • 🌐 Decentralized Protection Network
+
+📊 Contract Addresses:
+   GitHubRepoProtection: 0x19054030669efBFc413bA3729b63eCfD3Bdc22B5
+   LinkRegistry:         0x5fa19b4a48C20202055c8a6fdf16688633617D50
+   InfringementBounty:   0xA2cD4CC41b8DCE00D002Aa4B29050f2d53705400
+{'=' * 90}
+
+"""
+
+_HELP = f"""
+📚 Available Commands:
+{'-' * 70}
+🔗 BLOCKCHAIN COMMANDS:
+blockchain-status
+   Check Filecoin network connection and account balance
+   Example: blockchain-status
+
+register-blockchain <url> [license_type]
+   Register repository on Filecoin blockchain
+   License types: MIT, Apache-2.0, GPL-3.0, BSD-3-Clause, AGPL-3.0, Custom-AI
+   Example: register-blockchain https://github.com/user/repo MIT
+
+query-repos [start_id] [limit]
+   Query repositories registered on blockchain
+   Example: query-repos 1 5
+
+workflow-blockchain <url>
+   Run complete blockchain-backed protection workflow
+   Example: workflow-blockchain github.com/user/repo
+
+report-bounty <infringing_url> <license_cid> <dmca_cid>
+   Report infringement and earn bounty rewards
+   Example: report-bounty github.com/bad/repo QmLicense123 QmDMCA456
+
+💡 ENHANCED ANALYSIS COMMANDS:
+analyze <url1> <url2>
+   Compare repositories with blockchain verification
+   Example: analyze github.com/user1/repo1 github.com/user2/repo2
+
+audit <url> [--extensive]
+   Security audit with blockchain evidence storage
+   Example: audit github.com/user/repo --extensive
+
+scan [repo_id]
+   Scan for violations with blockchain DMCA filing
+   Example: scan 1
+
+🔧 UTILITY COMMANDS:
+list
+   List cached repositories
+
+help
+   Show this help message
+
+quit/exit
+   Exit the agent
+{'-' * 70}
+
+"""
+
+_SETUP_GUIDE = f"""
+⚙️ BLOCKCHAIN SETUP GUIDE:
+{'-' * 50}
+1. Set up environment variables:
+   PRIVATE_KEY=your_private_key_here
+   FILECOIN_RPC_URL=https://rpc.ankr.com/filecoin_testnet
+   PINATA_API_KEY=your_pinata_key
+   PINATA_API_SECRET=your_pinata_secret
+
+2. Get tFIL testnet tokens:
+   Visit: https://faucet.calibration.fildev.network/
+
+3. Optional for local development:
+   USE_LOCAL_MODEL=true (uses Ollama instead of OpenAI)
+
+4. Required for OpenAI mode:
+   OPENAI_API_KEY=your_openai_key
+   GITHUB_TOKEN=your_github_token
+{'-' * 50}
+
+"""
+
 
 def print_banner():
     """Print welcome banner with blockchain features"""
-    print("\n" + "="*90)
-    print("🛡️  BLOCKCHAIN-ENHANCED GitHub Repository Protection Agent v5.0")
-    print("="*90)
-    print("✨ New Blockchain Features:")
-    print("   • 🔗 Filecoin Calibration Testnet Integration")
-    print("   • ⛓️ Smart Contract Repository Registration")
-    print("   • 📄 IPFS License & DMCA Storage")
-    print("   • 💰 Infringement Bounty System")
-    print("   • 🔒 Immutable Evidence Storage")
-    print("   • 🌐 Decentralized Protection Network")
-    print("\n📊 Contract Addresses:")
-    print("   GitHubRepoProtection: 0x19054030669efBFc413bA3729b63eCfD3Bdc22B5")
-    print("   LinkRegistry:         0x5fa19b4a48C20202055c8a6fdf16688633617D50")
-    print("   InfringementBounty:   0xA2cD4CC41b8DCE00D002Aa4B29050f2d53705400")
-    print("="*90 + "\n")
+    sys.stdout.write(_BANNER)
 
 
 def print_help():
     """Print help information with blockchain commands"""
-    print("\n📚 Available Commands:")
-    print("-" * 70)
-    print("🔗 BLOCKCHAIN COMMANDS:")
-    print("blockchain-status")
-    print("   Check Filecoin network connection and account balance")
-    print("   Example: blockchain-status")
-    print()
-    print("register-blockchain <url> [license_type]")
-    print("   Register repository on Filecoin blockchain")
-    print("   License types: MIT, Apache-2.0, GPL-3.0, BSD-3-Clause, AGPL-3.0, Custom-AI")
-    print("   Example: register-blockchain https://github.com/user/repo MIT")
-    print()
-    print("query-repos [start_id] [limit]")
-    print("   Query repositories registered on blockchain")
-    print("   Example: query-repos 1 5")
-    print()
-    print("workflow-blockchain <url>")
-    print("   Run complete blockchain-backed protection workflow")
-    print("   Example: workflow-blockchain github.com/user/repo")
-    print()
-    print("report-bounty <infringing_url> <license_cid> <dmca_cid>")
-    print("   Report infringement and earn bounty rewards")
-    print("   Example: report-bounty github.com/bad/repo QmLicense123 QmDMCA456")
-    print()
-    print("💡 ENHANCED ANALYSIS COMMANDS:")
-    print("analyze <url1> <url2>")
-    print("   Compare repositories with blockchain verification")
-    print("   Example: analyze github.com/user1/repo1 github.com/user2/repo2")
-    print()
-    print("audit <url> [--extensive]")
-    print("   Security audit with blockchain evidence storage")
-    print("   Example: audit github.com/user/repo --extensive")
-    print()
-    print("scan [repo_id]")
-    print("   Scan for violations with blockchain DMCA filing")
-    print("   Example: scan 1")
-    print()
-    print("🔧 UTILITY COMMANDS:")
-    print("list")
-    print("   List cached repositories")
-    print()
-    print("help")
-    print("   Show this help message")
-    print()
-    print("quit/exit")
-    print("   Exit the agent")
-    print("-" * 70 + "\n")
+    sys.stdout.write(_HELP)
 
 
 def print_setup_guide():
     """Print setup guide for blockchain functionality"""
-    print("\n⚙️ BLOCKCHAIN SETUP GUIDE:")
-    print("-" * 50)
-    print("1. Set up environment variables:")
-    print("   PRIVATE_KEY=your_private_key_here")
-    print("   FILECOIN_RPC_URL=https://rpc.ankr.com/filecoin_testnet")
-    print("   PINATA_API_KEY=your_pinata_key")
-    print("   PINATA_API_SECRET=your_pinata_secret")
-    print()
-    print("2. Get tFIL testnet tokens:")
-    print("   Visit: https://faucet.calibration.fildev.network/")
-    print()
-    print("3. Optional for local development:")
-    print("   USE_LOCAL_MODEL=true (uses Ollama instead of OpenAI)")
-    print()
-    print("4. Required for OpenAI mode:")
-    print("   OPENAI_API_KEY=your_openai_key")
-    print("   GITHUB_TOKEN=your_github_token")
-    print("-" * 50 + "\n")
+    sys.stdout.write(_SETUP_GUIDE)
+
+
+def emit(*lines):
+    """Write lines to stdout with a single write call"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def cmd_blockchain_status(agent, args):
+    """Show network, account, balance and contract details"""
+    print("🔍 Checking blockchain status...")
+    status = cached_read(_read_cache, ('status',), lambda: refresh_status(agent))
+    
+    if status['success']:
+        lines = [
+            f"\n✅ Blockchain Connection Status",
+            f"🌐 Network: {status['network']}",
+            f"🔗 Chain ID: {status['chain_id']}",
+            f"👤 Account: {status['account_address']}",
+            f"💰 Balance: {status['balance_tfil']:.6f} tFIL",
+            f"📊 Total Registered Repos: {status['total_registered_repos']}",
+            f"\n📋 Contract Addresses:"
+        ]
+        lines.extend(f"   {name}: {address}" for name, address in status['contracts'].items())
+        
+        if status.get('gas_estimates', {}).get('success'):
+            gas_info = status['gas_estimates']
+            lines.append(f"\n⛽ Gas Estimates:")
+            lines.append(f"   Current Gas Price: {gas_info['gas_price_gwei']:.2f} Gwei")
+            for op_name, op_info in gas_info['operations'].items():
+                lines.append(f"   {op_name.replace('_', ' ').title()}: ~{op_info['cost_fil']:.6f} tFIL")
+        emit(*lines)
+    else:
+        print(f"❌ Error: {status['error']}")
+
+
+def cmd_register_blockchain(agent, args):
+    """Register a repository on chain: register-blockchain <url> [license_type]"""
+    if not args:
+        print("❌ Usage: register-blockchain <url> [license_type]")
+        return
+    
+    license_type = args[1] if len(args) > 1 else "MIT"
+    print(f"⛓️ Registering repository on blockchain with {license_type} license...")
+    
+    result = agent.register_repository_blockchain(args[0], license_type)
+    _read_cache.clear()
+    
+    if result['success']:
+        emit(
+            f"\n✅ Repository Registered on Blockchain!",
+            f"📋 Repo ID: {result['repo_id']}",
+            f"⛓️ Main TX: {result['tx_hash']}",
+            f"🔗 Link Registry TX: {result['link_registry_tx']}",
+            f"📦 Block: {result['block_number']}",
+            f"⛽ Gas Used: {result['gas_used']:,}",
+            f"📄 License PDF: {result['license']['pdf_path']}",
+            f"🌐 IPFS URL: {result['license']['ipfs_url']}",
+            f"💰 Estimated Cost: {result['gas_used'] * 0.000000001:.6f} tFIL"
+        )
+    else:
+        print(f"❌ Error: {result['error']}")
+
+
+def format_repo_record(repo):
+    """Render one registered repository for query-repos"""
+    ipfs = f"{repo['ipfs_metadata'][:20]}..." if repo['ipfs_metadata'] else "N/A"
+    return (
+        f"ID: {repo['id']}\n"
+        f"   URL: {repo['github_url']}\n"
+        f"   Owner: {repo['owner']}\n"
+        f"   License: {repo['license_type']}\n"
+        f"   Registered: {repo['registered_at']}\n"
+        f"   IPFS: {ipfs}\n"
+        f"   Active: {'✅' if repo['is_active'] else '❌'}\n"
+        "\n"
+    )
+
+
+def cmd_query_repos(agent, args):
+    """List registered repositories: query-repos [start_id] [limit]"""
+    start_id = int(args[0]) if args else 1
+    limit = int(args[1]) if len(args) > 1 else 10
+    key = ('query-repos', start_id, limit)
+    
+    print(f"📊 Querying blockchain repositories (starting from ID {start_id})...")
+    
+    # Stream records as pages arrive; only a completed pass is cached for repeat queries
+    if _read_cache.get(key) is None and hasattr(agent, 'iter_registered_repositories'):
+        emit(f"\n📚 Blockchain Registered Repositories ({start_id}-{start_id + limit - 1}):", "-" * 80)
+        repositories = []
+        try:
+            for repo in agent.iter_registered_repositories(start_id, limit):
+                sys.stdout.write(format_repo_record(repo))
+                sys.stdout.flush()
+                repositories.append(repo)
+            total = agent.contract_interface.get_total_repositories()
+        except Exception as e:
+            print(f"❌ Error: {e}")
+            return
+        
+        print(f"📊 Showing {len(repositories)}/{total} repositories")
+        _read_cache[key] = {
+            'success': True,
+            'query_range': f"{start_id}-{start_id + limit - 1}",
+            'total_repositories': total,
+            'repositories': repositories
+        }
+        return
+    
+    result = cached_read(
+        _read_cache,
+        key,
+        lambda: agent.query_registered_repositories(start_id, limit)
+    )
+    
+    if result['success']:
+        out = io.StringIO()
+        out.write(f"\n📚 Blockchain Registered Repositories ({result['query_range']}):\n")
+        out.write(f"Total on blockchain: {result['total_repositories']}\n")
+        out.write("-" * 80 + "\n")
+        
+        for repo in result['repositories']:
+            out.write(format_repo_record(repo))
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
+    else:
+        print(f"❌ Error: {result['error']}")
+
+
+def cmd_workflow_blockchain(agent, args):
+    """Run the full protection workflow: workflow-blockchain <url>"""
+    if not args:
+        print("❌ Usage: workflow-blockchain <url>")
+        return
+    
+    print("🚀 Running complete blockchain protection workflow...")
+    result = agent.run_protection_workflow_blockchain(args[0])
+    _read_cache.clear()
+    
+    if result.get('success'):
+        summary = result['summary']
+        lines = [
+            f"\n✅ Blockchain Workflow Complete!",
+            f"📋 Repo ID: {summary['repo_id']}",
+            f"⛓️ Blockchain Confirmed: {summary['blockchain_confirmed']}",
+            f"🔒 Security Findings: {summary['security_findings']}",
+            f"⚠️ Violations Found: {summary['violations_found']}",
+            f"📄 DMCA Notices Filed: {summary['dmca_notices_filed']}",
+            f"🔗 Total Transactions: {summary['total_blockchain_transactions']}",
+            f"✅ Protection Active: {summary['protection_active']}",
+            f"\n⛓️ Blockchain Transactions:"
+        ]
+        for i, tx in enumerate(result['blockchain_transactions'], 1):
+            lines.append(f"   {i}. {tx['type'].replace('_', ' ').title()}: {tx['tx_hash']}")
+        emit(*lines)
+    else:
+        print(f"❌ Error: {result.get('error', 'Unknown error')}")
+
+
+def cmd_report_bounty(agent, args):
+    """Report an infringement for bounty: report-bounty <infringing_url> <license_cid> <dmca_cid>"""
+    if len(args) < 3:
+        print("❌ Usage: report-bounty <infringing_url> <license_cid> <dmca_cid>")
+        return
+    
+    print("💰 Reporting infringement for bounty...")
+    result = agent.report_infringement_with_bounty(args[0], args[1], args[2])
+    _read_cache.clear()
+    
+    if result['success']:
+        emit(
+            f"\n✅ Infringement Reported!",
+            f"🔗 URL: {result['infringing_url']}",
+            f"⛓️ Add Link TX: {result['add_link_tx']}",
+            f"📄 DMCA TX: {result['dmca_tx']}",
+            f"💰 Bounty Earned: {result['bounty_earned']} {result['bounty_currency']}"
+        )
+    else:
+        print(f"❌ Error: {result['error']}")
+
+
+def cmd_analyze(agent, args):
+    """Compare two repositories: analyze <url1> <url2>"""
+    if len(args) < 2:
+        print("❌ Usage: analyze <url1> <url2>")
+        return
+    
+    print("🔍 Analyzing repositories with blockchain verification...")
+    result = agent.analyze_repositories(args[0], args[1])
+    
+    if result['success']:
+        lines = [
+            f"\n✅ Analysis Complete",
+            f"📊 Overall Similarity: {result['similarity_analysis']['overall_similarity']:.2%}",
+            f"🔗 {result['recommendation']}"
+        ]
+        
+        if result['blockchain_matches']:
+            lines.append(f"\n⛓️ Found {len(result['blockchain_matches'])} blockchain-registered repositories with similarities!")
+            for match in result['blockchain_matches']:
+                lines.append(f"   Repo ID {match['repo_id']}: {match['similarity']:.2%} similar")
+        emit(*lines)
+    else:
+        print(f"❌ Error: {result['error']}")
+
+
+def cmd_audit(agent, args):
+    """Security audit with evidence storage: audit <url> [--extensive]"""
+    if not args:
+        print("❌ Usage: audit <url> [--extensive]")
+        return
+    
+    extensive = '--extensive' in args
+    mode = "EXTENSIVE (all commits)" if extensive else "standard"
+    print(f"🔒 Running {mode} security audit with blockchain evidence storage...")
+    
+    result = agent.comprehensive_audit(args[0], include_all_commits=extensive)
+    
+    if result['success']:
+        lines = [
+            f"\n✅ Audit Complete",
+            f"📁 Files scanned: {result['files_scanned']}",
+            f"📊 Commits scanned: {result.get('commits_scanned', 'N/A')}",
+            f"🚨 Total findings: {result['total_findings']}",
+            f"   Critical: {result['critical_findings']}",
+            f"   High: {result['high_findings']}",
+            f"   Medium: {result['medium_findings']}",
+            f"   Low: {result['low_findings']}"
+        ]
+        
+        if result.get('report'):
+            lines.append(f"\n📄 Blockchain Evidence Report:")
+            lines.append(f"   IPFS: {result['report']['ipfs_url']}")
+            if result['report'].get('blockchain_pin'):
+                pin_info = result['report']['blockchain_pin']
+                lines.append(f"   Blockchain TX: {pin_info.get('transaction_hash', 'N/A')}")
+        emit(*lines)
+    else:
+        print(f"❌ Error: {result['error']}")
+
+
+def cmd_scan(agent, args):
+    """Scan GitHub for violations: scan [repo_id]"""
+    repo_id = int(args[0]) if args else None
+    target = f"repository {repo_id}" if repo_id else "all blockchain registered repositories"
+    print(f"🔎 Scanning GitHub for violations of {target}...")
+    
+    result = agent.scan_github_for_violations(repo_id)
+    _read_cache.clear()
+    
+    if result['success']:
+        out = io.StringIO()
+        out.write(
+            f"\n✅ Scan Complete\n"
+            f"📊 Repositories scanned: {result['repositories_scanned']}\n"
+            f"⚠️ Violations found: {result['violations_found']}\n"
+            f"📄 DMCA notices generated: {result['dmca_notices_generated']}\n"
+            f"⛓️ Blockchain backed: {result['blockchain_backed']}\n"
+        )
+        
+        for notice in result['dmca_notices']:
+            out.write(
+                f"\n🚨 DMCA Notice #{notice['id']}:\n"
+                f"   Infringing URL: {notice['infringing_url']}\n"
+                f"   Similarity: {notice['similarity_score']:.2%}\n"
+                f"   IPFS: {notice['ipfs_url']}\n"
+                f"   DMCA TX: {notice['dmca_blockchain_tx']}\n"
+                f"   Violation TX: {notice['violation_blockchain_tx']}\n"
+            )
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
+    else:
+        print(f"❌ Error: {result['error']}")
+
+
+def cmd_list(agent, args):
+    """List repositories in the local cache"""
+    if not agent.repositories:
+        emit(
+            "📭 No repositories in local cache",
+            "💡 Use 'query-repos' to see blockchain registered repositories"
+        )
+    else:
+        out = io.StringIO()
+        out.write(f"\n📚 Cached Repositories ({len(agent.repositories)}):\n")
+        out.write("-" * 60 + "\n")
+        for repo_id, repo_data in agent.repositories.items():
+            out.write(
+                f"ID: {repo_id}\n"
+                f"   URL: {repo_data['github_url']}\n"
+                f"   License: {repo_data['license_type']}\n"
+                f"   Registered: {repo_data['registered_at'][:10]}\n"
+                f"   Blockchain: {'✅' if repo_data.get('blockchain_confirmed') else '❌'}\n"
+            )
+            if repo_data.get('tx_hash'):
+                out.write(f"   TX: {repo_data['tx_hash'][:16]}...\n")
+            out.write("\n")
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
+
+
+# REPL command -> handler(agent, args); help, setup and quit/exit are handled inline
+COMMANDS = {
+    'blockchain-status': cmd_blockchain_status,
+    'register-blockchain': cmd_register_blockchain,
+    'query-repos': cmd_query_repos,
+    'workflow-blockchain': cmd_workflow_blockchain,
+    'report-bounty': cmd_report_bounty,
+    'analyze': cmd_analyze,
+    'audit': cmd_audit,
+    'scan': cmd_scan,
+    'list': cmd_list
+}
+
+
+def make_prompt():
+    """Return a prompt function: prompt_toolkit with history and completion on a terminal, else input()"""
+    if not PROMPT_TOOLKIT_AVAILABLE or not sys.stdin.isatty():
+        return input
+    
+    completer = WordCompleter(['help', 'setup', 'quit', 'exit', *COMMANDS], sentence=True)
+    return PromptSession(completer=completer).prompt
 
 
 def main():
     """Enhanced main function with blockchain support"""
+    parser = argparse.ArgumentParser(description="Blockchain-enhanced GitHub repository protection agent")
+    parser.add_argument('--fast', '--no-status', action='store_true',
+                        help="skip the blockchain status check on startup")
+    cli_args = parser.parse_args()
+    
+    load_env_file(os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env'))
+    
     config = {
         'USE_LOCAL_MODEL': os.getenv('USE_LOCAL_MODEL', 'false').lower() == 'true',
         'OPENAI_API_KEY': os.getenv('OPENAI_API_KEY'),
         'GITHUB_TOKEN': os.getenv('GITHUB_TOKEN'),
         'PRIVATE_KEY': os.getenv('PRIVATE_KEY'),
         'FILECOIN_RPC_URL': os.getenv('FILECOIN_RPC_URL', 'https://rpc.ankr.com/filecoin_testnet'),
+        'FILECOIN_RPC_URLS': os.getenv('FILECOIN_RPC_URLS'),
+        'FILECOIN_WS_URL': os.getenv('FILECOIN_WS_URL'),
         'PINATA_API_KEY': os.getenv('PINATA_API_KEY'),
         'PINATA_API_SECRET': os.getenv('PINATA_API_SECRET'),
         'WEB3_STORAGE_TOKEN': os.getenv('WEB3_STORAGE_TOKEN')
@@ -125,37 +541,58 @@ def main():
         logger.warning("⚠️ No PRIVATE_KEY set - running in read-only mode")
     
     try:
+        # Heavy import (web3, langchain, IPFS clients) deferred until the config is valid
+        from github_protection_agent.blockchain_enhanced_agent import BlockchainEnhancedGitHubProtectionAgent
         agent = BlockchainEnhancedGitHubProtectionAgent(config)
+        
+        # Open the LLM connection (a free model listing) while the banner and status are shown
+        prewarm(lambda: agent.llm.root_client.models.list())
         print_banner()
         
-        # Show blockchain status
-        status = agent.get_blockchain_status()
-        if status['success']:
-            print("🔗 Blockchain Status:")
-            print(f"   Network: {status['network']}")
-            print(f"   Account: {status['account_address']}")
-            print(f"   Balance: {status['balance_tfil']:.4f} tFIL")
-            print(f"   Registered Repos: {status['total_registered_repos']}")
+        # Show blockchain status: a fresh persisted copy renders instantly and is revalidated in the background
+        global _status_source
+        _status_source = status_source(config)
+        if not cli_args.fast:
+            status = load_saved_status(_status_source)
+            if status:
+                threading.Thread(target=refresh_status, args=(agent,), daemon=True).start()
+            else:
+                status = refresh_status(agent)
             
-            # Show gas estimates
-            if status.get('gas_estimates', {}).get('success'):
-                gas_info = status['gas_estimates']
-                print(f"   Gas Price: {gas_info['gas_price_gwei']:.2f} Gwei")
-                print(f"   Register Cost: ~{gas_info['operations']['register_repository']['cost_fil']:.6f} tFIL")
-        else:
-            print(f"⚠️ Blockchain connection issue: {status['error']}")
+            if status['success']:
+                lines = [
+                    "🔗 Blockchain Status:",
+                    f"   Network: {status['network']}",
+                    f"   Account: {status['account_address']}",
+                    f"   Balance: {status['balance_tfil']:.4f} tFIL",
+                    f"   Registered Repos: {status['total_registered_repos']}"
+                ]
+                
+                # Show gas estimates
+                if status.get('gas_estimates', {}).get('success'):
+                    gas_info = status['gas_estimates']
+                    lines.append(f"   Gas Price: {gas_info['gas_price_gwei']:.2f} Gwei")
+                    lines.append(f"   Register Cost: ~{gas_info['operations']['register_repository']['cost_fil']:.6f} tFIL")
+                emit(*lines)
+            else:
+                print(f"⚠️ Blockchain connection issue: {status['error']}")
         
         print_help()
         
+        prompt = make_prompt()
         while True:
             try:
-                user_input = input("🔗 Blockchain Agent> ").strip()
+                user_input = prompt("🔗 Blockchain Agent> ").strip()
                 
                 if not user_input:
                     continue
                 
-                parts = user_input.split()
-                command = parts[0].lower()
+                # Quoted arguments may contain spaces
+                try:
+                    command, args = parse_command(user_input)
+                except ValueError as e:
+                    print(f"❌ Could not parse command: {e}")
+                    continue
                 
                 if command in ['quit', 'exit']:
                     print("👋 Goodbye!")
@@ -167,216 +604,11 @@ def main():
                 elif command == 'setup':
                     print_setup_guide()
                 
-                elif command == 'blockchain-status':
-                    print("🔍 Checking blockchain status...")
-                    status = agent.get_blockchain_status()
-                    
-                    if status['success']:
-                        print(f"\n✅ Blockchain Connection Status")
-                        print(f"🌐 Network: {status['network']}")
-                        print(f"🔗 Chain ID: {status['chain_id']}")
-                        print(f"👤 Account: {status['account_address']}")
-                        print(f"💰 Balance: {status['balance_tfil']:.6f} tFIL")
-                        print(f"📊 Total Registered Repos: {status['total_registered_repos']}")
-                        
-                        print(f"\n📋 Contract Addresses:")
-                        for name, address in status['contracts'].items():
-                            print(f"   {name}: {address}")
-                        
-                        if status.get('gas_estimates', {}).get('success'):
-                            gas_info = status['gas_estimates']
-                            print(f"\n⛽ Gas Estimates:")
-                            print(f"   Current Gas Price: {gas_info['gas_price_gwei']:.2f} Gwei")
-                            for op_name, op_info in gas_info['operations'].items():
-                                print(f"   {op_name.replace('_', ' ').title()}: ~{op_info['cost_fil']:.6f} tFIL")
-                    else:
-                        print(f"❌ Error: {status['error']}")
-                
-                elif command == 'register-blockchain':
-                    if len(parts) < 2:
-                        print("❌ Usage: register-blockchain <url> [license_type]")
-                        continue
-                    
-                    license_type = parts[2] if len(parts) > 2 else "MIT"
-                    print(f"⛓️ Registering repository on blockchain with {license_type} license...")
-                    
-                    result = agent.register_repository_blockchain(parts[1], license_type)
-                    
-                    if result['success']:
-                        print(f"\n✅ Repository Registered on Blockchain!")
-                        print(f"📋 Repo ID: {result['repo_id']}")
-                        print(f"⛓️ Main TX: {result['tx_hash']}")
-                        print(f"🔗 Link Registry TX: {result['link_registry_tx']}")
-                        print(f"📦 Block: {result['block_number']}")
-                        print(f"⛽ Gas Used: {result['gas_used']:,}")
-                        print(f"📄 License PDF: {result['license']['pdf_path']}")
-                        print(f"🌐 IPFS URL: {result['license']['ipfs_url']}")
-                        print(f"💰 Estimated Cost: {result['gas_used'] * 0.000000001:.6f} tFIL")
-                    else:
-                        print(f"❌ Error: {result['error']}")
-                
-                elif command == 'query-repos':
-                    start_id = int(parts[1]) if len(parts) > 1 else 1
-                    limit = int(parts[2]) if len(parts) > 2 else 10
-                    
-                    print(f"📊 Querying blockchain repositories (starting from ID {start_id})...")
-                    result = agent.query_registered_repositories(start_id, limit)
-                    
-                    if result['success']:
-                        print(f"\n📚 Blockchain Registered Repositories ({result['query_range']}):")
-                        print(f"Total on blockchain: {result['total_repositories']}")
-                        print("-" * 80)
-                        
-                        for repo in result['repositories']:
-                            print(f"ID: {repo['id']}")
-                            print(f"   URL: {repo['github_url']}")
-                            print(f"   Owner: {repo['owner']}")
-                            print(f"   License: {repo['license_type']}")
-                            print(f"   Registered: {repo['registered_at']}")
-                            print(f"   IPFS: {repo['ipfs_metadata'][:20]}..." if repo['ipfs_metadata'] else "   IPFS: N/A")
-                            print(f"   Active: {'✅' if repo['is_active'] else '❌'}")
-                            print()
-                    else:
-                        print(f"❌ Error: {result['error']}")
-                
-                elif command == 'workflow-blockchain':
-                    if len(parts) < 2:
-                        print("❌ Usage: workflow-blockchain <url>")
-                        continue
-                    
-                    print("🚀 Running complete blockchain protection workflow...")
-                    result = agent.run_protection_workflow_blockchain(parts[1])
-                    
-                    if result.get('success'):
-                        print(f"\n✅ Blockchain Workflow Complete!")
-                        summary = result['summary']
-                        print(f"📋 Repo ID: {summary['repo_id']}")
-                        print(f"⛓️ Blockchain Confirmed: {summary['blockchain_confirmed']}")
-                        print(f"🔒 Security Findings: {summary['security_findings']}")
-                        print(f"⚠️ Violations Found: {summary['violations_found']}")
-                        print(f"📄 DMCA Notices Filed: {summary['dmca_notices_filed']}")
-                        print(f"🔗 Total Transactions: {summary['total_blockchain_transactions']}")
-                        print(f"✅ Protection Active: {summary['protection_active']}")
-                        
-                        print(f"\n⛓️ Blockchain Transactions:")
-                        for i, tx in enumerate(result['blockchain_transactions'], 1):
-                            print(f"   {i}. {tx['type'].replace('_', ' ').title()}: {tx['tx_hash']}")
-                    else:
-                        print(f"❌ Error: {result.get('error', 'Unknown error')}")
-                
-                elif command == 'report-bounty':
-                    if len(parts) < 4:
-                        print("❌ Usage: report-bounty <infringing_url> <license_cid> <dmca_cid>")
-                        continue
-                    
-                    print("💰 Reporting infringement for bounty...")
-                    result = agent.report_infringement_with_bounty(parts[1], parts[2], parts[3])
-                    
-                    if result['success']:
-                        print(f"\n✅ Infringement Reported!")
-                        print(f"🔗 URL: {result['infringing_url']}")
-                        print(f"⛓️ Add Link TX: {result['add_link_tx']}")
-                        print(f"📄 DMCA TX: {result['dmca_tx']}")
-                        print(f"💰 Bounty Earned: {result['bounty_earned']} {result['bounty_currency']}")
-                    else:
-                        print(f"❌ Error: {result['error']}")
-                
-                elif command == 'analyze':
-                    if len(parts) < 3:
-                        print("❌ Usage: analyze <url1> <url2>")
-                        continue
-                    
-                    print("🔍 Analyzing repositories with blockchain verification...")
-                    result = agent.analyze_repositories(parts[1], parts[2])
-                    
-                    if result['success']:
-                        print(f"\n✅ Analysis Complete")
-                        print(f"📊 Overall Similarity: {result['similarity_analysis']['overall_similarity']:.2%}")
-                        print(f"🔗 {result['recommendation']}")
-                        
-                        if result['blockchain_matches']:
-                            print(f"\n⛓️ Found {len(result['blockchain_matches'])} blockchain-registered repositories with similarities!")
-                            for match in result['blockchain_matches']:
-                                print(f"   Repo ID {match['repo_id']}: {match['similarity']:.2%} similar")
-                    else:
-                        print(f"❌ Error: {result['error']}")
-                
-                elif command == 'audit':
-                    if len(parts) < 2:
-                        print("❌ Usage: audit <url> [--extensive]")
-                        continue
-                    
-                    extensive = '--extensive' in parts
-                    mode = "EXTENSIVE (all commits)" if extensive else "standard"
-                    print(f"🔒 Running {mode} security audit with blockchain evidence storage...")
-                    
-                    result = agent.comprehensive_audit(parts[1], include_all_commits=extensive)
-                    
-                    if result['success']:
-                        print(f"\n✅ Audit Complete")
-                        print(f"📁 Files scanned: {result['files_scanned']}")
-                        print(f"📊 Commits scanned: {result.get('commits_scanned', 'N/A')}")
-                        print(f"🚨 Total findings: {result['total_findings']}")
-                        print(f"   Critical: {result['critical_findings']}")
-                        print(f"   High: {result['high_findings']}")
-                        print(f"   Medium: {result['medium_findings']}")
-                        print(f"   Low: {result['low_findings']}")
-                        
-                        if result.get('report'):
-                            print(f"\n📄 Blockchain Evidence Report:")
-                            print(f"   IPFS: {result['report']['ipfs_url']}")
-                            if result['report'].get('blockchain_pin'):
-                                pin_info = result['report']['blockchain_pin']
-                                print(f"   Blockchain TX: {pin_info.get('transaction_hash', 'N/A')}")
-                    else:
-                        print(f"❌ Error: {result['error']}")
-                
-                elif command == 'scan':
-                    repo_id = int(parts[1]) if len(parts) > 1 else None
-                    target = f"repository {repo_id}" if repo_id else "all blockchain registered repositories"
-                    print(f"🔎 Scanning GitHub for violations of {target}...")
-                    
-                    result = agent.scan_github_for_violations(repo_id)
-                    
-                    if result['success']:
-                        print(f"\n✅ Scan Complete")
-                        print(f"📊 Repositories scanned: {result['repositories_scanned']}")
-                        print(f"⚠️ Violations found: {result['violations_found']}")
-                        print(f"📄 DMCA notices generated: {result['dmca_notices_generated']}")
-                        print(f"⛓️ Blockchain backed: {result['blockchain_backed']}")
-                        
-                        for notice in result['dmca_notices']:
-                            print(f"\n🚨 DMCA Notice #{notice['id']}:")
-                            print(f"   Infringing URL: {notice['infringing_url']}")
-                            print(f"   Similarity: {notice['similarity_score']:.2%}")
-                            print(f"   IPFS: {notice['ipfs_url']}")
-                            print(f"   DMCA TX: {notice['dmca_blockchain_tx']}")
-                            print(f"   Violation TX: {notice['violation_blockchain_tx']}")
-                    else:
-                        print(f"❌ Error: {result['error']}")
-                
-                elif command == 'list':
-                    if not agent.repositories:
-                        print("📭 No repositories in local cache")
-                        print("💡 Use 'query-repos' to see blockchain registered repositories")
-                    else:
-                        print(f"\n📚 Cached Repositories ({len(agent.repositories)}):")
-                        print("-" * 60)
-                        for repo_id, repo_data in agent.repositories.items():
-                            print(f"ID: {repo_id}")
-                            print(f"   URL: {repo_data['github_url']}")
-                            print(f"   License: {repo_data['license_type']}")
-                            print(f"   Registered: {repo_data['registered_at'][:10]}")
-                            print(f"   Blockchain: {'✅' if repo_data.get('blockchain_confirmed') else '❌'}")
-                            if repo_data.get('tx_hash'):
-                                print(f"   TX: {repo_data['tx_hash'][:16]}...")
-                            print()
-                
-                else:
+                elif not dispatch_command(COMMANDS, command, agent, args):
                     print(f"❌ Unknown command: {command}")
                     print("💡 Type 'help' for available commands")
                 
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError):
                 print("\n👋 Goodbye!")
                 break
             except Exception as e:
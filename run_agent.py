@@ -11,9 +11,9 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
-# Load environment variables
-from dotenv import load_dotenv
-load_dotenv()
+# Load environment variables (skipped entirely when there is no .env)
+from github_protection_agent.utils import load_env_file
+load_env_file(os.path.join(current_dir, '.env'))
 
 def main():
     """Main entry point"""
@@ -4,6 +4,8 @@ Quick test script to verify all modules can be imported correctly
 """
 import sys
 import os
+import importlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Add project root to path
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -34,15 +36,23 @@ def test_imports():
     
     success_count = 0
     
-    for module_name in modules_to_test:
-        try:
-            __import__(module_name)
-            print(f"  ✅ {module_name}")
-            success_count += 1
-        except ImportError as e:
-            print(f"  ❌ {module_name}: {e}")
-        except Exception as e:
-            print(f"  ⚠️  {module_name}: {e}")
+    # Imports are I/O bound (site-packages reads) and guarded by per-module locks,
+    # so they can run side by side; results are printed as they finish
+    with ThreadPoolExecutor(max_workers=min(8, len(modules_to_test))) as executor:
+        futures = {
+            executor.submit(importlib.import_module, module_name): module_name
+            for module_name in modules_to_test
+        }
+        for future in as_completed(futures):
+            module_name = futures[future]
+            try:
+                future.result()
+                print(f"  ✅ {module_name}")
+                success_count += 1
+            except ImportError as e:
+                print(f"  ❌ {module_name}: {e}")
+            except Exception as e:
+                print(f"  ⚠️  {module_name}: {e}")
     
     print(f"\n📊 Import Results: {success_count}/{len(modules_to_test)} modules imported successfully")
     